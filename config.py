@@ -0,0 +1,44 @@
+import os
+from typing import FrozenSet, Optional
+
+# Hosts whose content only appears after JS runs; static scraping is skipped for these
+# (subdomains of a listed host match too, see is_js_required_host)
+DEFAULT_JS_REQUIRED_HOSTS = frozenset({
+    "vercel.com", "www.vercel.com",
+    "ycombinator.com", "www.ycombinator.com", "news.ycombinator.com",
+})
+
+
+def _load_js_required_hosts() -> FrozenSet[str]:
+    # Extra hosts can be supplied without a code change:
+    #   JS_REQUIRED_HOSTS="a.com,b.com" and/or JS_REQUIRED_HOSTS_FILE=/path (one host per line)
+    hosts = set(DEFAULT_JS_REQUIRED_HOSTS)
+
+    env_hosts = os.environ.get("JS_REQUIRED_HOSTS", "")
+    hosts.update(h.strip().lower() for h in env_hosts.split(",") if h.strip())
+
+    hosts_file = os.environ.get("JS_REQUIRED_HOSTS_FILE")
+    if hosts_file and os.path.exists(hosts_file):
+        with open(hosts_file) as f:
+            for line in f:
+                line = line.strip().lower()
+                if line and not line.startswith("#"):
+                    hosts.add(line)
+
+    return frozenset(hosts)
+
+
+JS_REQUIRED_HOSTS = _load_js_required_hosts()
+
+
+def is_js_required_host(host: Optional[str]) -> bool:
+    # Match the host itself or any parent domain, e.g. docs.vercel.com -> vercel.com
+    if not host:
+        return False
+    host = host.lower().rstrip(".")
+    parts = host.split(".")
+    return any(".".join(parts[i:]) in JS_REQUIRED_HOSTS for i in range(len(parts)))
+
+
+# Max dynamic scrapes running against the shared browser at the same time
+MAX_CONCURRENT_BROWSER_SCRAPES = int(os.environ.get("MAX_CONCURRENT_BROWSER_SCRAPES", "4"))
@@ -1,18 +1,60 @@
 from fastapi import FastAPI, Request, Form
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Any
+import asyncio
+import msgspec
 import uvicorn
 import os
 from contextlib import asynccontextmanager
-from scraper import StaticScraper, DynamicScraper
+from urllib.parse import urlparse
+from scraper import StaticScraper, DynamicScraper, SharedBrowser, new_http_transport
 
-from models import ScrapeRequest, ScrapeResponse
+from models import ScrapeRequest, ScrapeResponse, ScrapeResult
+from config import MAX_CONCURRENT_BROWSER_SCRAPES, is_js_required_host
 
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Launch Chromium once; each dynamic scrape gets its own cheap BrowserContext.
+    # A failed warm-up isn't fatal: static scraping and /healthz still work, and
+    # the browser is retried on the next dynamic scrape.
+    app.state.browser = SharedBrowser()
+    try:
+        await app.state.browser.get()
+    except Exception as e:
+        print(f"Chromium launch failed at startup ({e}); will retry on first dynamic scrape.")
+    # Bounds how many scrapes share the browser at once (speculative ones included)
+    app.state.browser_slots = asyncio.Semaphore(MAX_CONCURRENT_BROWSER_SCRAPES)
+    # One pooled HTTP transport for all static fetches (each scrape gets its own client)
+    app.state.http_transport = new_http_transport()
+    try:
+        yield
+    finally:
+        await app.state.http_transport.aclose()
+        await app.state.browser.close()
+
+
+app = FastAPI(lifespan=lifespan)
+
+# /scrape returns msgspec structs directly, so FastAPI can't derive its response
+# schema; generate it from msgspec and register the referenced structs as components
+(_SCRAPE_RESPONSE_SCHEMA,), _RESULT_SCHEMA_COMPONENTS = msgspec.json.schema_components(
+    (ScrapeResponse,), ref_template="#/components/schemas/{name}"
+)
+
+
+def _openapi():
+    if app.openapi_schema is None:
+        schema = FastAPI.openapi(app)
+        components = schema.setdefault("components", {}).setdefault("schemas", {})
+        components.update(_RESULT_SCHEMA_COMPONENTS)
+    return app.openapi_schema
+
+
+app.openapi = _openapi
 
 # Setup templates
 templates = Jinja2Templates(directory="templates")
@@ -21,6 +63,55 @@ templates = Jinja2Templates(directory="templates")
 # Removing duplicate ScrapeRequest definitions as it is now imported from models
 
 
+_STREAM_CHUNK_BYTES = 65536
+
+
+async def _encode_response(result: ScrapeResult):
+    # Same JSON as msgspec.json.encode(ScrapeResponse(result=result)), emitted in
+    # ~64KB batches of sections. Async so Starlette writes it straight from the
+    # event loop instead of hopping to the threadpool for every chunk.
+    # Fields come from the struct itself so new ScrapeResult fields can't go missing.
+    encode = msgspec.json.encode
+    buf = bytearray(b'{"result":{')
+    for i, field in enumerate(ScrapeResult.__struct_fields__):
+        if i:
+            buf += b','
+        buf += encode(field) + b':'
+        value = getattr(result, field)
+        if field != "sections":
+            buf += encode(value)
+            continue
+        buf += b'['
+        for j, section in enumerate(value):
+            if j:
+                buf += b','
+            buf += encode(section)
+            if len(buf) >= _STREAM_CHUNK_BYTES:
+                yield bytes(buf)
+                buf.clear()
+        buf += b']'
+    buf += b'}}'
+    yield bytes(buf)
+
+
+def _json_response(payload: ScrapeResponse) -> StreamingResponse:
+    # Encode msgspec structs directly, bypassing FastAPI's Pydantic encoder
+    return StreamingResponse(_encode_response(payload.result), media_type="application/json")
+
+
+async def _scrape_dynamic(url: str, app: FastAPI):
+    async with app.state.browser_slots:
+        return await DynamicScraper(url, app.state.browser).scrape()
+
+
+def _http_transport(http_request: Request):
+    return http_request.app.state.http_transport
+
+
+def _dynamic_failed(result: ScrapeResult) -> bool:
+    return len(result.errors) > 0 or len(result.sections) == 0
+
+
 @app.get("/healthz")
 async def healthz():
     return {"status": "ok"}
@@ -29,14 +120,36 @@ async def healthz():
 async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
-@app.post("/scrape", response_model=ScrapeResponse)
-async def scrape(request: ScrapeRequest):
-    # 1. Try Scraper (Static)
-    static_scraper = StaticScraper(request.url)
-    result = await static_scraper.scrape()
+@app.post("/scrape", responses={
+    200: {"content": {"application/json": {"schema": _SCRAPE_RESPONSE_SCHEMA}}}
+})
+async def scrape(request: ScrapeRequest, http_request: Request):
+    # 0. Known JS-rendered hosts go straight to the browser; a static pass would be discarded
+    # hostname (not netloc) so ports and userinfo don't defeat the match
+    if is_js_required_host(urlparse(request.url).hostname):
+        result = await _scrape_dynamic(request.url, http_request.app)
+        if _dynamic_failed(result):
+            # Browser unavailable/broken: fall back to static and apply the same keep-static rule
+            static_scraper = StaticScraper(request.url, transport=_http_transport(http_request))
+            static_result = await static_scraper.scrape(force_rescrape=request.forceRescrape)
+            if len(static_result.sections) > 0:
+                print("Dynamic scraping failed or returned no sections; using Static result.")
+                result = static_result
+        return _json_response(ScrapeResponse(result=result))
+
+    # 1. Try Scraper (Static), with the dynamic scrape started speculatively alongside
+    # so a fallback costs max(static, dynamic) rather than static + dynamic
+    dynamic_task = asyncio.create_task(_scrape_dynamic(request.url, http_request.app))
+    static_scraper = StaticScraper(request.url, transport=_http_transport(http_request))
+    try:
+        result = await static_scraper.scrape(force_rescrape=request.forceRescrape)
+    except BaseException:
+        dynamic_task.cancel()
+        raise
     
     # 2. Check heuristics for fallback
     # Optimized: calculate total text length only once with generator expression
+    # This is the single text-length signal for fallback; StaticScraper does not compute its own
     total_text_len = sum(len(s.content.text) for s in result.sections)
     is_short = total_text_len < 2000
     
@@ -45,32 +158,36 @@ async def scrape(request: ScrapeRequest):
     # Or just use the text length heuristic + error check for now.
     # Also, if 0 sections found, definitely fallback.
     
-    has_errors = len(result.errors) > 0
+    # A truncated (>5MB) page is still a usable static result; re-rendering the
+    # same huge page in Chromium would defeat the size cap
+    has_errors = any(e.phase != "fetch_oversize" for e in result.errors)
     no_sections = len(result.sections) == 0
     
     should_fallback = is_short or has_errors or no_sections
-    
-    # Force fallback for known dynamic patterns if needed (optional)
-    # e.g. "vercel.com" often hides content behind JS
-    if "vercel.com" in request.url or "ycombinator.com" in request.url:
-         should_fallback = True
 
-    if should_fallback:
+    if not should_fallback:
+        # Static was good enough; stop the speculative browser scrape and let it clean up
+        dynamic_task.cancel()
+        # wait() doesn't raise the child's outcome, but still lets a cancellation
+        # of this handler propagate
+        await asyncio.wait({dynamic_task})
+        if not dynamic_task.cancelled():
+            dynamic_task.exception()  # mark as retrieved; the static result stands
+    else:
         print(f"Static scraping insufficient (len={total_text_len}, errs={len(result.errors)}). Falling back to Dynamic...")
-        dynamic_scraper = DynamicScraper(request.url)
-        dynamic_result = await dynamic_scraper.scrape()
+        dynamic_result = await dynamic_task
         
         # If dynamic failed drastically (e.g. browser error) but static had something, maybe keep static?
         # But usually dynamic is better.
         # Check if dynamic has critical error and NO sections, while static HAD sections.
-        if (len(dynamic_result.errors) > 0 or len(dynamic_result.sections) == 0) and len(result.sections) > 0:
+        if _dynamic_failed(dynamic_result) and len(result.sections) > 0:
              print("Dynamic scraping failed or returned no sections; reverting to Static result.")
              # Keep static result (do nothing, dynamic_result ignored)
              pass
         else:
              result = dynamic_result
         
-    return ScrapeResponse(result=result)
+    return _json_response(ScrapeResponse(result=result))
 
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,17 +1,23 @@
-from pydantic import BaseModel, Field, HttpUrl
+import msgspec
+from pydantic import BaseModel
 from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
+# Request stays Pydantic so FastAPI can validate the body and document it.
+# Result types are msgspec Structs: they're built thousands of times per scrape
+# and encoded straight to JSON, so skipping per-field validation matters.
+
 class ScrapeRequest(BaseModel):
     url: str
+    forceRescrape: bool = False # bypass the static result cache
 
-class MetaInfo(BaseModel):
+class MetaInfo(msgspec.Struct):
     title: Optional[str] = ""
     description: Optional[str] = ""
     language: Optional[str] = "en"
     canonical: Optional[str] = None
 
-class SectionContent(BaseModel):
+class SectionContent(msgspec.Struct):
     headings: List[str] = []
     text: str = ""
     links: List[Dict[str, str]] = [] # {"text": "...", "href": "..."}
@@ -19,7 +25,7 @@ class SectionContent(BaseModel):
     lists: List[List[str]] = []
     tables: List[Any] = []
 
-class Section(BaseModel):
+class Section(msgspec.Struct):
     id: str
     type: str # hero | section | nav | footer | list | grid | faq | pricing | unknown
     label: str
@@ -28,16 +34,16 @@ class Section(BaseModel):
     rawHtml: str
     truncated: bool
 
-class Interactions(BaseModel):
+class Interactions(msgspec.Struct):
     clicks: List[str] = []
     scrolls: int = 0
     pages: List[str] = []
 
-class ErrorLog(BaseModel):
+class ErrorLog(msgspec.Struct):
     message: str
     phase: str
 
-class ScrapeResult(BaseModel):
+class ScrapeResult(msgspec.Struct):
     url: str
     scrapedAt: str
     meta: MetaInfo
@@ -45,5 +51,5 @@ class ScrapeResult(BaseModel):
     interactions: Interactions
     errors: List[ErrorLog] = []
 
-class ScrapeResponse(BaseModel):
+class ScrapeResponse(msgspec.Struct):
     result: ScrapeResult
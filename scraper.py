@@ -2,11 +2,16 @@ import httpx
 from bs4 import BeautifulSoup, Tag
 from datetime import datetime, timezone
 from urllib.parse import urljoin
+from functools import lru_cache
 from typing import List, Optional
 import asyncio
+import hashlib
+
+import msgspec
+from cachetools import TTLCache
 
 # Playwright
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 from models import ScrapeResult, MetaInfo, Section, SectionContent, Interactions, ErrorLog
 
@@ -14,6 +19,167 @@ DEFAULT_HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 }
 
+# Recent static results keyed by requested URL, stored as serialized JSON bytes
+# so we don't keep whole result object graphs alive between requests.
+RESULT_CACHE = TTLCache(maxsize=512, ttl=300)
+_RESULT_CACHE_LOCK = asyncio.Lock()
+
+# Parsed results keyed by a hash of (final URL, exact HTML), so aliases that
+# redirect to the same page and re-polls of an unchanged page skip parsing.
+# Both parts matter: links and sourceUrl are resolved against the final URL,
+# and any byte change (prices, dates, scores) must produce a fresh parse.
+PARSE_CACHE = TTLCache(maxsize=512, ttl=300)
+
+
+def _content_fingerprint(final_url: str, html: str) -> bytes:
+    digest = hashlib.sha256(final_url.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(html.encode("utf-8", errors="replace"))
+    return digest.digest()
+
+
+# Cap on bytes read per static fetch; anything beyond this is not worth parsing
+MAX_RESPONSE_BYTES = 5_000_000
+
+# urljoin re-parses the base URL on every call; sections share one base and pages
+# repeat the same hrefs (nav, footer), so memoize on (base_url, href)
+_cached_urljoin = lru_cache(maxsize=4096)(urljoin)
+
+# Longer hrefs (and inline data: URIs, often hundreds of KB) bypass the cache so
+# it can't pin large strings in memory for the life of the process
+MAX_CACHED_HREF_CHARS = 2048
+
+
+def _resolve_url(base_url: str, href: str) -> str:
+    if len(href) > MAX_CACHED_HREF_CHARS or href[:5].lower() == "data:":
+        return urljoin(base_url, href)
+    return _cached_urljoin(base_url, href)
+
+
+_SECTION_SELECTOR = "header, nav, main, section, footer, article"
+
+# Scrolls to the bottom and resolves with the body height before and after waiting
+_SCROLL_AND_MEASURE_JS = """(waitMs) => {
+    const prev = document.body.scrollHeight;
+    window.scrollTo(0, prev);
+    return new Promise(resolve => setTimeout(
+        () => resolve({prev: prev, next: document.body.scrollHeight}), waitMs));
+}"""
+
+_BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font", "websocket", "other"))
+
+
+async def _block_heavy_resources(route):
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+# Strong references to fire-and-forget cleanup tasks so they aren't GC'd mid-flight
+_BACKGROUND_TASKS = set()
+
+
+def _close_orphaned_context(task):
+    if not task.cancelled() and task.exception() is None:
+        close_task = asyncio.ensure_future(task.result().close())
+        _BACKGROUND_TASKS.add(close_task)
+        close_task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+# Per-section extraction caps
+MAX_HEADINGS = 20
+MAX_LINKS = 50
+MAX_IMAGES = 20
+MAX_LISTS = 10
+MAX_LIST_ITEMS = 20
+
+MAX_RAW_HTML_CHARS = 1000
+
+
+def _tag_bounds(tag: Tag):
+    # Opening/closing markup for a tag exactly as bs4 would render it, without
+    # touching its children
+    if tag.is_empty_element:
+        return tag.decode(), ""
+    shell = Tag(name=tag.name, attrs=tag.attrs, prefix=tag.prefix).decode()
+    split = shell.rfind("</")
+    return shell[:split], shell[split:]
+
+
+def _iter_html(node: Tag):
+    # Yields the same markup as str(node), piece by piece in document order
+    stack = [(iter((node,)), "")]
+    while stack:
+        children, closer = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            yield closer
+        elif isinstance(child, Tag):
+            opener, child_closer = _tag_bounds(child)
+            yield opener
+            stack.append((iter(child.contents), child_closer))
+        else:
+            yield child.output_ready()
+
+
+def _truncated_html(node: Tag, limit: int):
+    # Serialize only until we pass the limit instead of rendering a whole
+    # (possibly multi-MB) subtree and then discarding most of it
+    parts = []
+    size = 0
+    for piece in _iter_html(node):
+        parts.append(piece)
+        size += len(piece)
+        if size > limit:
+            return "".join(parts)[:limit] + "...", True
+    return "".join(parts), False
+
+
+_SEC_TYPE = {"nav": "nav", "footer": "footer", "header": "hero"}
+
+# Tags _extract_content cares about, mapped to what it extracts from them
+_CONTENT_TAG_KIND = {
+    "h1": "heading", "h2": "heading", "h3": "heading",
+    "h4": "heading", "h5": "heading", "h6": "heading",
+    "a": "link",
+    "img": "image",
+    "ul": "list", "ol": "list",
+    "li": "item",
+}
+
+
+def new_http_transport() -> httpx.AsyncHTTPTransport:
+    # Keep-alive pool + HTTP/2 so repeat hosts skip the TCP/TLS handshake.
+    # Only the transport is shared: cookies live on the client, and one site's
+    # cookies must not follow into later, unrelated scrapes.
+    return httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+
+
+class _BorrowedTransport(httpx.AsyncBaseTransport):
+    # Lets a short-lived client use the shared pool without closing it on exit
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+
+def new_http_client(transport: Optional[httpx.AsyncBaseTransport] = None) -> httpx.AsyncClient:
+    # Per-scrape client (fresh cookie jar); reuses the shared pool when given one
+    return httpx.AsyncClient(
+        transport=_BorrowedTransport(transport) if transport is not None else None,
+        http2=True,
+        follow_redirects=True,
+        timeout=30.0,
+        headers=DEFAULT_HEADERS,
+    )
+
+
 class BaseScraper:
     def __init__(self, url: str):
         self.url = url
@@ -58,7 +224,8 @@ class BaseScraper:
             return []
 
         # Limit candidates to prevent processing huge DOMs - top 100 semantic elements
-        candidates = body.find_all(['header', 'nav', 'main', 'section', 'footer', 'article'], limit=100)
+        # A single CSS selector (compiled once and cached by Soup Sieve) instead of a name list
+        candidates = body.select(_SECTION_SELECTOR, limit=100)
         if not candidates:
             candidates = [body]
         
@@ -68,10 +235,7 @@ class BaseScraper:
             if node in processed_nodes:
                 continue
                 
-            sec_type = "section"
-            if node.name == 'nav': sec_type = 'nav'
-            elif node.name == 'footer': sec_type = 'footer'
-            elif node.name == 'header': sec_type = 'hero'
+            sec_type = _SEC_TYPE.get(node.name, "section")
             
             content = self._extract_content(node, base_url)
             
@@ -83,15 +247,12 @@ class BaseScraper:
             if content.headings:
                 label = content.headings[0]
             else:
-                words = content.text.split()
+                # maxsplit stops after the words we need instead of splitting the whole text
+                words = content.text.split(maxsplit=7)
                 if words:
                     label = " ".join(words[:7]) + "..."
             
-            raw_html = str(node)
-            truncated = False
-            if len(raw_html) > 1000:
-                raw_html = raw_html[:1000] + "..."
-                truncated = True
+            raw_html, truncated = _truncated_html(node, MAX_RAW_HTML_CHARS)
 
             sec_id = f"{sec_type}-{i}"
 
@@ -112,29 +273,64 @@ class BaseScraper:
         # Extract text once for reuse
         text = element.get_text(separator=" ", strip=True)
         
-        # Batch all heading extractions in one pass
-        headings = [h.get_text(strip=True) for h in element.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], limit=20)]
-        
-        # Limit and extract links efficiently
-        links = []
-        for a in element.find_all('a', href=True, limit=50):
-            href = urljoin(base_url, a['href'])
-            links.append({"text": a.get_text(strip=True), "href": href})
-            
-        # Limit and extract images efficiently
-        images = []
-        for img in element.find_all('img', src=True, limit=20):
-            src = urljoin(base_url, img['src'])
-            alt = img.get('alt', '')
-            images.append({"src": src, "alt": alt})
-            
-        # Extract lists with early termination
-        lists = []
-        for ul in element.find_all(['ul', 'ol'], limit=10):
-            items = [li.get_text(strip=True) for li in ul.find_all('li', limit=20)]
-            if items:
-                lists.append(items)
-                
+        # Fixed-size slots with fill counters: the caps are known up front, so
+        # there's no list growth and the quota checks are plain int compares
+        headings = [None] * MAX_HEADINGS
+        links = [None] * MAX_LINKS
+        images = [None] * MAX_IMAGES
+        n_headings = n_links = n_images = 0
+        # Lists in document order, plus a lookup from list tag to its items so
+        # nested <li> can be credited to every enclosing list like find_all did
+        list_items = []
+        open_lists = {}
+
+        # Single walk over the subtree instead of one find_all sweep per tag kind
+        for node in element.descendants:
+            if not isinstance(node, Tag):
+                continue
+            # One dict lookup classifies the tag; most nodes (div, p, span...) stop here
+            kind = _CONTENT_TAG_KIND.get(node.name)
+            if kind is None:
+                continue
+            if kind == 'heading':
+                if n_headings < MAX_HEADINGS:
+                    headings[n_headings] = node.get_text(strip=True)
+                    n_headings += 1
+            elif kind == 'link':
+                if n_links < MAX_LINKS and node.get('href') is not None:
+                    href = _resolve_url(base_url, node['href'])
+                    links[n_links] = {"text": node.get_text(strip=True), "href": href}
+                    n_links += 1
+            elif kind == 'image':
+                if n_images < MAX_IMAGES and node.get('src') is not None:
+                    src = _resolve_url(base_url, node['src'])
+                    alt = node.get('alt', '')
+                    images[n_images] = {"src": src, "alt": alt}
+                    n_images += 1
+            elif kind == 'list':
+                if len(list_items) < MAX_LISTS:
+                    items = []
+                    list_items.append(items)
+                    open_lists[id(node)] = items
+            elif kind == 'item' and open_lists:
+                for parent in node.parents:
+                    if parent is element:
+                        break
+                    items = open_lists.get(id(parent))
+                    if items is not None and len(items) < MAX_LIST_ITEMS:
+                        items.append(node.get_text(strip=True))
+
+            # Early termination once every quota is met and no list still wants items
+            if (n_headings == MAX_HEADINGS and n_links == MAX_LINKS and n_images == MAX_IMAGES
+                    and len(list_items) == MAX_LISTS
+                    and all(len(items) == MAX_LIST_ITEMS for items in list_items)):
+                break
+
+        headings = headings[:n_headings]
+        links = links[:n_links]
+        images = images[:n_images]
+        lists = [items for items in list_items if items]
+
         return SectionContent(
             headings=headings,
             text=text,
@@ -145,13 +341,46 @@ class BaseScraper:
         )
 
 class StaticScraper(BaseScraper):
-    async def scrape(self) -> ScrapeResult:
+    def __init__(self, url: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        super().__init__(url)
+        # Shared connection pool owned by the app lifespan; httpx's default if None
+        self.transport = transport
+
+    async def _fetch(self, client: httpx.AsyncClient):
+        # Stream the body so a huge page can't be pulled fully into memory
+        async with client.stream("GET", self.url) as response:
+            response.raise_for_status()
+            chunks = []
+            total = 0
+            oversize = False
+            async for chunk in response.aiter_bytes(65536):
+                total += len(chunk)
+                if total > MAX_RESPONSE_BYTES:
+                    oversize = True
+                    break
+                chunks.append(chunk)
+            html = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+            return html, str(response.url), oversize
+
+    async def scrape(self, force_rescrape: bool = False) -> ScrapeResult:
+        if not force_rescrape:
+            async with _RESULT_CACHE_LOCK:
+                cached = RESULT_CACHE.get(self.url)
+            if cached is not None:
+                return msgspec.json.decode(cached, type=ScrapeResult)
+
+        result = await self._scrape()
+
+        # Only cache clean results so transient fetch errors get retried
+        if not result.errors:
+            async with _RESULT_CACHE_LOCK:
+                RESULT_CACHE[self.url] = msgspec.json.encode(result)
+        return result
+
+    async def _scrape(self) -> ScrapeResult:
         try:
-            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0, headers=DEFAULT_HEADERS) as client:
-                response = await client.get(self.url)
-                response.raise_for_status()
-                html = response.text
-                final_url = str(response.url)
+            async with new_http_client(self.transport) as client:
+                html, final_url, oversize = await self._fetch(client)
         except Exception as e:
             self.errors.append(ErrorLog(message=str(e), phase="fetch"))
             result = ScrapeResult(
@@ -164,23 +393,30 @@ class StaticScraper(BaseScraper):
             )
             return result
 
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Heuristic: If content is very short, maybe we need JS?
-        text_len = len(soup.get_text(strip=True))
-        if text_len < 500:
-             # Fallback to Dynamic
-             # NOTE: In a real system, we might return a specific signal to the caller.
-             # For this assignment, we'll just switch to DynamicScraper here or let the caller decide.
-             # I will implement self-switching logic in main or here.
-             # For now, let's keep it simple: Static is Static. The main.py will handle fallback? 
-             # Or better: StaticScraper can delegate?
-             pass
+        if oversize:
+            self.errors.append(ErrorLog(
+                message=f"Response exceeded {MAX_RESPONSE_BYTES} bytes; parsing truncated body",
+                phase="fetch_oversize"
+            ))
+
+        digest = None
+        if not self.errors:
+            digest = _content_fingerprint(final_url, html)
+            cached = PARSE_CACHE.get(digest)
+            if cached is not None:
+                return msgspec.structs.replace(
+                    msgspec.json.decode(cached, type=ScrapeResult),
+                    url=self.url,
+                    scrapedAt=datetime.now(timezone.utc).isoformat(),
+                    interactions=Interactions(pages=[final_url]),
+                )
 
+        soup = BeautifulSoup(html, 'lxml')
+        
         meta = self._extract_meta(soup, final_url)
         sections = self._extract_sections(soup, final_url)
         
-        return ScrapeResult(
+        result = ScrapeResult(
             url=self.url,
             scrapedAt=datetime.now(timezone.utc).isoformat(),
             meta=meta,
@@ -188,59 +424,133 @@ class StaticScraper(BaseScraper):
             interactions=Interactions(pages=[final_url]),
             errors=self.errors
         )
+        if digest is not None:
+            PARSE_CACHE[digest] = msgspec.json.encode(result)
+        return result
+
+
+class SharedBrowser:
+    # One Chromium shared by all dynamic scrapes. Launched lazily and relaunched
+    # if it crashes/disconnects, so a dead browser doesn't fail every later scrape.
+    def __init__(self):
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> Browser:
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=True)
+            return self._browser
+
+    async def close(self):
+        async with self._lock:
+            if self._browser is not None:
+                try:
+                    await self._browser.close()
+                except Exception:
+                    pass
+                self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
 
 class DynamicScraper(BaseScraper):
+    def __init__(self, url: str, browser: SharedBrowser):
+        super().__init__(url)
+        # Shared browser owned by the app lifespan; we only open/close contexts
+        self.browser = browser
+
     async def scrape(self) -> ScrapeResult:
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(user_agent=DEFAULT_HEADERS["User-Agent"], ignore_https_errors=True)
+        try:
+            context = await self._open_context()
+        except Exception as e:
+            # Chromium missing or failed to (re)launch: report it like other scrape errors
+            self.errors.append(ErrorLog(message=str(e), phase="playwright_launch"))
+            return self._partial_result()
+
+        try:
+            # Pixels, fonts and media aren't needed (we read <img src> from the HTML),
+            # and skipping them lets networkidle settle much sooner
+            await context.route("**/*", _block_heavy_resources)
             page = await context.new_page()
-            
-            try:
-                # 1. Navigate
-                await page.goto(self.url, timeout=30000, wait_until="networkidle")
-                self.visited_pages.add(page.url)
-                
-                # 2. Interactions (Click tabs / Load More)
-                await self._perform_clicks(page)
-                
-                # 3. Pagination / Infinite Scroll
-                await self._perform_scroll_or_pagination(page)
-                
-                # 4. Extract Content
-                content = await page.content()
-                soup = BeautifulSoup(content, 'html.parser')
-                
-                meta = self._extract_meta(soup, page.url)
-                sections = self._extract_sections(soup, page.url)
-                
-                return ScrapeResult(
-                    url=self.url,
-                    scrapedAt=datetime.now(timezone.utc).isoformat(),
-                    meta=meta,
-                    sections=sections,
-                    interactions=Interactions(
-                        clicks=self.clicks_attempted,
-                        scrolls=self.scroll_count,
-                        pages=list(self.visited_pages)
-                    ),
-                    errors=self.errors
-                )
-                
-            except Exception as e:
-                self.errors.append(ErrorLog(message=str(e), phase="playwright_interaction"))
-                # Try to return whatever we have
-                return ScrapeResult(
-                    url=self.url,
-                    scrapedAt=datetime.now(timezone.utc).isoformat(),
-                    meta=MetaInfo(),
-                    sections=[],
-                    interactions=Interactions(clicks=self.clicks_attempted, scrolls=self.scroll_count, pages=list(self.visited_pages)),
-                    errors=self.errors
-                )
-            finally:
-                await browser.close()
+
+            # 1. Navigate
+            await page.goto(self.url, timeout=30000, wait_until="domcontentloaded")
+            await self._wait_for_content(page)
+            self.visited_pages.add(page.url)
+
+            # 2. Interactions (Click tabs / Load More)
+            await self._perform_clicks(page)
+
+            # 3. Pagination / Infinite Scroll
+            await self._perform_scroll_or_pagination(page)
+
+            # 4. Extract Content
+            content = await page.content()
+            soup = BeautifulSoup(content, 'lxml')
+
+            meta = self._extract_meta(soup, page.url)
+            sections = self._extract_sections(soup, page.url)
+
+            return ScrapeResult(
+                url=self.url,
+                scrapedAt=datetime.now(timezone.utc).isoformat(),
+                meta=meta,
+                sections=sections,
+                interactions=Interactions(
+                    clicks=self.clicks_attempted,
+                    scrolls=self.scroll_count,
+                    pages=list(self.visited_pages)
+                ),
+                errors=self.errors
+            )
+
+        except Exception as e:
+            self.errors.append(ErrorLog(message=str(e), phase="playwright_interaction"))
+            # Try to return whatever we have
+            return self._partial_result()
+        finally:
+            # Never close the shared browser here, only this request's context
+            await context.close()
+
+    def _partial_result(self) -> ScrapeResult:
+        return ScrapeResult(
+            url=self.url,
+            scrapedAt=datetime.now(timezone.utc).isoformat(),
+            meta=MetaInfo(),
+            sections=[],
+            interactions=Interactions(clicks=self.clicks_attempted, scrolls=self.scroll_count, pages=list(self.visited_pages)),
+            errors=self.errors
+        )
+
+    async def _open_context(self) -> BrowserContext:
+        # Speculative scrapes get cancelled; open the context in its own task so a
+        # cancel mid-creation can't leave an orphaned context in the shared browser
+        browser = await self.browser.get()
+        task = asyncio.ensure_future(
+            browser.new_context(user_agent=DEFAULT_HEADERS["User-Agent"], ignore_https_errors=True)
+        )
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            task.add_done_callback(_close_orphaned_context)
+            raise
+
+    async def _wait_for_content(self, page: Page):
+        # networkidle can hang for seconds on analytics beacons / long-polls, so
+        # wait for visible text instead and give networkidle only a short window
+        try:
+            await page.wait_for_function("document.body && document.body.innerText.length > 200", timeout=5000)
+        except Exception:
+            pass
+        try:
+            await page.wait_for_load_state("networkidle", timeout=2000)
+        except Exception:
+            pass
 
     async def _perform_clicks(self, page: Page):
         # Optimized: Use combined selector and limit iterations to reduce query overhead
@@ -250,32 +560,39 @@ class DynamicScraper(BaseScraper):
             'button:has-text("Load more"), button:has-text("Show more"), .load-more, #load-more'  # Combined load more selectors
         ]
         
-        for sel in selectors:
+        # Discover both groups concurrently; they match disjoint elements
+        discovered = await asyncio.gather(
+            *(page.locator(sel).all() for sel in selectors), return_exceptions=True
+        )
+
+        for sel, elements in zip(selectors, discovered):
+            if isinstance(elements, Exception):
+                continue
             try:
-                # Limit to first 3 visible elements to avoid excessive clicking
-                elements = await page.locator(sel).all()
-                for i, el in enumerate(elements):
-                    if i >= 3:  # Early termination after 3 clicks per selector group
-                        break
-                    if await el.is_visible():
-                        txt = await el.text_content()
+                # Limit to first 3 elements to avoid excessive clicking
+                elements = elements[:3]
+                # Probe visibility and text for all of them at once; clicks stay serial
+                # below since each one can mutate the DOM
+                probes = await asyncio.gather(
+                    *(asyncio.gather(el.is_visible(), el.text_content()) for el in elements)
+                )
+                for el, (visible, txt) in zip(elements, probes):
+                    if visible:
                         await el.click(timeout=2000)
                         await page.wait_for_timeout(500) # Reduced wait time from 1000ms
-                        self.clicks_attempted.append(f"{sel} (text: {txt.strip()[:20]})")
+                        self.clicks_attempted.append(f"{sel} (text: {(txt or '').strip()[:20]})")
             except Exception:
                 pass
 
     async def _perform_scroll_or_pagination(self, page: Page):
         # 1. Infinite scroll check - optimized with adaptive waiting
         for i in range(3):
-            previous_height = await page.evaluate("document.body.scrollHeight")
-            await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             # Adaptive wait: shorter for subsequent scrolls if no change
             wait_time = 1500 if i == 0 else 1000  # Reduced from 2000ms
-            await page.wait_for_timeout(wait_time)
-            new_height = await page.evaluate("document.body.scrollHeight")
+            # Measure, scroll, wait and re-measure in one CDP round-trip
+            heights = await page.evaluate(_SCROLL_AND_MEASURE_JS, wait_time)
             self.scroll_count += 1
-            if new_height <= previous_height:
+            if heights["next"] <= heights["prev"]:
                 break  # Early termination if no new content loaded
         
         # 2. Pagination check (Next button)
@@ -288,7 +605,8 @@ class DynamicScraper(BaseScraper):
             if await next_link.count() and await next_link.is_visible():
                 try:
                     await next_link.click()
-                    await page.wait_for_load_state("networkidle", timeout=10000)
+                    await page.wait_for_load_state("domcontentloaded", timeout=10000)
+                    await self._wait_for_content(page)
                     self.visited_pages.add(page.url)
                     depth += 1
                 except Exception:
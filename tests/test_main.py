@@ -0,0 +1,91 @@
+from main import app
+
+
+def test_openapi_documents_scrape_response():
+    schema = app.openapi()
+
+    response = schema["paths"]["/scrape"]["post"]["responses"]["200"]
+    assert response["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/ScrapeResponse"}
+
+    components = schema["components"]["schemas"]
+    assert components["ScrapeResponse"]["properties"]["result"] == {
+        "$ref": "#/components/schemas/ScrapeResult"}
+    for name in ("ScrapeResult", "Section", "SectionContent",
+                 "MetaInfo", "Interactions", "ErrorLog"):
+        assert name in components
+    assert "ScrapeRequest" in components
+
+
+def test_scrape_handler_cancellation_propagates(monkeypatch):
+    import asyncio
+
+    import main
+    from models import Interactions, MetaInfo, ScrapeRequest, ScrapeResult, Section, SectionContent
+
+    section = Section(id="main-0", type="section", label="L", sourceUrl="u",
+                      content=SectionContent(text="x" * 3000), rawHtml="", truncated=False)
+
+    class FakeStaticScraper:
+        def __init__(self, url, transport=None):
+            self.url = url
+
+        async def scrape(self, force_rescrape=False):
+            await asyncio.sleep(0.01)  # let the speculative dynamic task start
+            return ScrapeResult(url=self.url, scrapedAt="t", meta=MetaInfo(),
+                                sections=[section], interactions=Interactions())
+
+    async def slow_dynamic(url, app):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            # Slow cleanup: the handler is still waiting on us when it gets cancelled
+            await asyncio.sleep(0.1)
+            raise
+
+    monkeypatch.setattr(main, "StaticScraper", FakeStaticScraper)
+    monkeypatch.setattr(main, "_scrape_dynamic", slow_dynamic)
+
+    class FakeRequest:
+        app = main.app
+
+    main.app.state.http_transport = None
+
+    async def run():
+        handler = asyncio.create_task(
+            main.scrape(ScrapeRequest(url="https://example.com/"), FakeRequest()))
+        await asyncio.sleep(0.05)
+        handler.cancel()
+        try:
+            await handler
+        except asyncio.CancelledError:
+            return "cancelled"
+        return "returned"
+
+    assert asyncio.run(run()) == "cancelled"
+
+
+def test_streamed_response_matches_msgspec_encoding():
+    import asyncio
+
+    import msgspec
+
+    from main import _encode_response
+    from models import (ErrorLog, Interactions, MetaInfo, ScrapeResponse, ScrapeResult,
+                        Section, SectionContent)
+
+    async def collect(result):
+        return [chunk async for chunk in _encode_response(result)]
+
+    section = Section(id="section-0", type="section", label='"L"', sourceUrl="https://e.com/",
+                      content=SectionContent(text="x" * 2000, links=[{"text": "a", "href": "b"}]),
+                      rawHtml="<p>" * 100, truncated=True)
+    for count in (0, 1, 3, 200):
+        result = ScrapeResult(url="https://e.com/", scrapedAt="t", meta=MetaInfo(title="T"),
+                              sections=[section] * count, interactions=Interactions(scrolls=2),
+                              errors=[ErrorLog(message="m", phase="fetch")])
+        chunks = asyncio.run(collect(result))
+
+        assert b"".join(chunks) == msgspec.json.encode(ScrapeResponse(result=result))
+        if count == 200:
+            assert len(chunks) > 1
@@ -0,0 +1,153 @@
+from bs4 import BeautifulSoup
+
+from scraper import BaseScraper, MAX_LINKS, _truncated_html
+
+BASE_URL = "https://example.com/docs/"
+
+TRICKY_HTML = """<!DOCTYPE html><html lang="en"><body><!-- c -->
+<main class="a b" data-x='say "hi"' title="a&amp;b &lt;x&gt;">
+<h1 id=t>T &amp; U</h1><h2>Sub</h2><br>
+<img src="x.png" alt="&quot;q'"><img alt="no src">
+<p>x &lt; y &gt; z&nbsp;é</p>
+<a href="/abs">abs</a><a href="rel">rel</a><a>no href</a><a href="">empty</a>
+<script>if (a < b && c) {}</script><style>a>b{}</style>
+<ul><li>a<ul><li>nested</li></ul></li><li>b</li></ul>
+<ol></ol><input disabled><![CDATA[x]]>
+</main></body></html>"""
+
+
+def _find_all_content(element):
+    # The original find_all-based extraction, kept as the reference behaviour
+    return {
+        "headings": [h.get_text(strip=True) for h in element.find_all(
+            ["h1", "h2", "h3", "h4", "h5", "h6"], limit=20)],
+        "links": [a["href"] for a in element.find_all("a", href=True, limit=50)],
+        "images": [img["src"] for img in element.find_all("img", src=True, limit=20)],
+        "lists": [items for items in (
+            [li.get_text(strip=True) for li in ul.find_all("li", limit=20)]
+            for ul in element.find_all(["ul", "ol"], limit=10)
+        ) if items],
+    }
+
+
+def test_extract_content_caps_links_on_huge_section():
+    links = "".join(f'<a href="/l{i}">link {i}</a>' for i in range(10000))
+    soup = BeautifulSoup(f"<html><body><section>{links}</section></body></html>", "lxml")
+
+    content = BaseScraper(BASE_URL)._extract_content(soup.section, BASE_URL)
+
+    assert len(content.links) == MAX_LINKS == 50
+    assert content.links[0] == {"text": "link 0", "href": "https://example.com/l0"}
+
+
+def test_extract_content_matches_find_all_extraction():
+    soup = BeautifulSoup(TRICKY_HTML, "lxml")
+    expected = _find_all_content(soup.main)
+
+    content = BaseScraper(BASE_URL)._extract_content(soup.main, BASE_URL)
+
+    assert content.headings == expected["headings"]
+    assert [link["href"] for link in content.links] == [
+        "https://example.com/abs", BASE_URL + "rel", BASE_URL]
+    assert len(content.links) == len(expected["links"])
+    assert [img["src"] for img in content.images] == [BASE_URL + "x.png"]
+    assert len(content.images) == len(expected["images"])
+    assert content.lists == expected["lists"]
+
+
+def test_truncated_html_matches_str_for_both_parsers():
+    for parser in ("lxml", "html.parser"):
+        soup = BeautifulSoup(TRICKY_HTML, parser)
+        for node in (soup.html, soup.body, soup.main):
+            assert _truncated_html(node, 10**9) == (str(node), False)
+
+
+def test_truncated_html_cuts_at_limit():
+    soup = BeautifulSoup(TRICKY_HTML, "lxml")
+
+    raw_html, truncated = _truncated_html(soup.main, 100)
+
+    assert truncated
+    assert raw_html == str(soup.main)[:100] + "..."
+
+
+def test_resolve_url_skips_cache_for_data_and_long_hrefs():
+    from scraper import _cached_urljoin, _resolve_url
+
+    _cached_urljoin.cache_clear()
+    data_uri = "data:image/png;base64," + "A" * 100
+    long_href = "/p?" + "x" * 5000
+
+    assert _resolve_url(BASE_URL, data_uri) == data_uri
+    assert _resolve_url(BASE_URL, long_href) == "https://example.com" + long_href
+    assert _cached_urljoin.cache_info().currsize == 0
+
+    assert _resolve_url(BASE_URL, "rel") == BASE_URL + "rel"
+    assert _cached_urljoin.cache_info().currsize == 1
+
+
+def test_cancelled_dynamic_scrape_closes_late_context():
+    import asyncio
+
+    from scraper import DynamicScraper
+
+    events = []
+
+    class FakeContext:
+        async def close(self):
+            events.append("closed")
+
+    class FakeBrowser:
+        async def get(self):
+            return self
+
+        async def new_context(self, **kwargs):
+            await asyncio.sleep(0.05)
+            events.append("opened")
+            return FakeContext()
+
+    async def run():
+        task = asyncio.create_task(DynamicScraper(BASE_URL, FakeBrowser()).scrape())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            events.append("cancelled")
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run())
+
+    assert events == ["cancelled", "opened", "closed"]
+
+
+def test_static_scrapes_share_pool_but_not_cookies():
+    import asyncio
+
+    import httpx
+
+    from scraper import StaticScraper
+
+    seen_cookies = []
+    closed = []
+
+    def handler(request):
+        seen_cookies.append(request.headers.get("cookie"))
+        return httpx.Response(200, headers={"set-cookie": "sess=abc; Path=/"},
+                              html="<html><body><main><p>hello</p></main></body></html>")
+
+    class RecordingTransport(httpx.MockTransport):
+        async def aclose(self):
+            closed.append(True)
+
+    shared = RecordingTransport(handler)
+
+    async def run():
+        for path in ("/first", "/second"):
+            await StaticScraper(f"https://cookies.example{path}", transport=shared).scrape(
+                force_rescrape=True)
+
+    asyncio.run(run())
+
+    assert seen_cookies == [None, None]
+    assert closed == []